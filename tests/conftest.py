@@ -1,13 +1,14 @@
 """Test configuration and fixtures."""
 
-from unittest.mock import AsyncMock, Mock, patch
+from collections.abc import Iterator
+from unittest.mock import AsyncMock, Mock
 
 import pytest
 from fastapi import FastAPI
 from fastapi.testclient import TestClient
 
-from fastapi_agentrouter import get_agent, router
-from fastapi_agentrouter.core.settings import Settings, SlackSettings, get_settings
+from fastapi_agentrouter import router
+from fastapi_agentrouter.core.settings import Settings, SlackSettings
 
 
 class MockAgent:
@@ -39,59 +40,62 @@ def get_agent_factory(mock_agent: MockAgent):
     return get_agent
 
 
-@pytest.fixture
-def test_app(get_agent_factory) -> FastAPI:
-    """Create a test FastAPI application with Slack enabled."""
-    app = FastAPI()
-    # Override the placeholder dependency
-    app.dependency_overrides[get_agent] = get_agent_factory
-    # Enable Slack for testing by default
-    app.dependency_overrides[get_settings] = lambda: Settings(
+@pytest.fixture(scope="session")
+def slack_enabled_settings() -> Settings:
+    """Provide settings with Slack configured, shared across the session."""
+    return Settings(
         slack=SlackSettings(bot_token="test-token", signing_secret="test-secret")
     )
-    app.include_router(router)
-    return app
 
 
-@pytest.fixture
-def test_app_slack_disabled(get_agent_factory) -> FastAPI:
-    """Create a test FastAPI application with Slack disabled."""
+@pytest.fixture(scope="session")
+def slack_disabled_settings() -> Settings:
+    """Provide settings with Slack disabled, shared across the session."""
+    return Settings(slack=None)
+
+
+@pytest.fixture(scope="session")
+def base_app() -> FastAPI:
+    """Create a FastAPI application shared by the whole test session.
+
+    The router is included only once; tests configure it through
+    ``dependency_overrides`` instead of building their own app.
+    """
     app = FastAPI()
-    # Override the placeholder dependency
-    app.dependency_overrides[get_agent] = get_agent_factory
-    # Disable Slack
-    app.dependency_overrides[get_settings] = lambda: Settings(slack=None)
     app.include_router(router)
     return app
 
 
-@pytest.fixture
-def test_client(test_app: FastAPI) -> TestClient:
-    """Create a test client with Slack enabled."""
-    return TestClient(test_app)
+@pytest.fixture(scope="session")
+def base_client(base_app: FastAPI) -> TestClient:
+    """Create a test client for the shared application."""
+    return TestClient(base_app)
 
 
 @pytest.fixture
-def test_client_slack_disabled(test_app_slack_disabled: FastAPI) -> TestClient:
-    """Create a test client with Slack disabled."""
-    return TestClient(test_app_slack_disabled)
+def client(base_app: FastAPI, base_client: TestClient) -> Iterator[TestClient]:
+    """Provide the shared test client with dependency overrides reset."""
+    base_app.dependency_overrides.clear()
+    yield base_client
+    base_app.dependency_overrides.clear()
 
 
 @pytest.fixture
-def mock_slack_app():
+def mock_slack_app(monkeypatch: pytest.MonkeyPatch) -> Mock:
     """Mock Slack App for testing."""
-    with patch("slack_bolt.App") as mock_app_class:
-        mock_app = Mock()
-        mock_app.event = Mock(return_value=lambda *args, **kwargs: None)
-        mock_app_class.return_value = mock_app
-        yield mock_app
+    mock_app = Mock()
+    mock_app.event = Mock(return_value=lambda *args, **kwargs: None)
+    monkeypatch.setattr("slack_bolt.App", lambda *args, **kwargs: mock_app)
+    return mock_app
 
 
 @pytest.fixture
-def mock_slack_handler():
+def mock_slack_handler(monkeypatch: pytest.MonkeyPatch) -> Mock:
     """Mock Slack request handler."""
-    with patch("slack_bolt.adapter.fastapi.SlackRequestHandler") as mock_handler_class:
-        mock_handler = Mock()
-        mock_handler.handle = AsyncMock(return_value={"ok": True})
-        mock_handler_class.return_value = mock_handler
-        yield mock_handler
+    mock_handler = Mock()
+    mock_handler.handle = AsyncMock(return_value={"ok": True})
+    monkeypatch.setattr(
+        "slack_bolt.adapter.fastapi.SlackRequestHandler",
+        lambda *args, **kwargs: mock_handler,
+    )
+    return mock_handler